@@ -5,6 +5,19 @@
 
 import base64
 
+try:
+    # pybase64 provides a SIMD-accelerated (libbase64) codec with the same
+    # semantics as the stdlib; base64 decode dominates CPU for large image
+    # payloads, so prefer it when available.
+    import pybase64
+
+    _b64decode = pybase64.b64decode
+    _b64encode = pybase64.b64encode
+except ImportError:
+    pybase64 = None
+    _b64decode = base64.b64decode
+    _b64encode = base64.b64encode
+
 
 def bytesfromhex(hex_input):
     """
@@ -57,7 +70,7 @@ def bytesfrombase64(base64_input):
         Base64 encoded string converted to bytes.
     """
 
-    return base64.b64decode(base64_input)
+    return _b64decode(base64_input)
 
 
 def base64frombytes(bytes_input, encoding="utf-8"):
@@ -75,4 +88,4 @@ def base64frombytes(bytes_input, encoding="utf-8"):
         base64 encoded string to store bytes in cuDF.
     """
 
-    return base64.b64encode(bytes_input).decode(encoding)
+    return _b64encode(bytes_input).decode(encoding)
@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import threading
+from functools import lru_cache
 from math import ceil
 from math import floor
 from typing import Optional
@@ -29,6 +31,25 @@ Image.MAX_IMAGE_PIXELS = None
 
 logger = logging.getLogger(__name__)
 
+# Thread-local scratch buffer reused across PIL encode/decode calls. PIL only
+# needs the file-like object for the duration of a single call, so one BytesIO
+# per thread avoids the per-call allocation churn of batched decoding (thread
+# pool workers each get their own buffer via the TLS).
+_TLS = threading.local()
+
+
+def _scratch_buffer(raw: bytes = b"") -> BytesIO:
+    """Return this thread's reusable BytesIO, reset and preloaded with ``raw``."""
+    buf = getattr(_TLS, "buf", None)
+    if buf is None:
+        buf = _TLS.buf = BytesIO()
+    buf.seek(0)
+    buf.truncate()
+    if raw:
+        buf.write(raw)
+        buf.seek(0)
+    return buf
+
 
 def _resize_image_opencv(array: np.ndarray, target_size: Tuple[int, int], interpolation=None) -> np.ndarray:
     """
@@ -146,7 +167,9 @@ def scale_image_to_encoding_size(
     -------
     Tuple[str, Tuple[int, int]]
         A tuple containing:
-        - Base64-encoded image string in the specified format, resized if necessary.
+        - Base64-encoded image string, resized and re-encoded in the specified format
+          if necessary. Images already within the size limit are returned unchanged
+          (original encoding preserved).
         - The new size as a tuple (width, height).
 
     Raises
@@ -155,16 +178,21 @@ def scale_image_to_encoding_size(
         If the image cannot be resized below the specified max_base64_size.
     """
     try:
-        # Decode the base64 image using OpenCV (returns RGB format)
-        img_array = base64_to_numpy(base64_image)
+        # Fast path: already within budget. Only the image header is read to report
+        # dimensions (PIL defers pixel decoding), so the common case skips the full
+        # decode + re-encode round trip entirely.
+        if len(base64_image) <= max_base64_size:
+            with Image.open(_scratch_buffer(bytetools.bytesfrombase64(base64_image))) as img:
+                original_size = img.size
+            return base64_image, original_size
+
+        # Decode the base64 image using OpenCV (returns RGB format). The cached
+        # variant skips the decode entirely when the same image is re-submitted.
+        img_array = base64_to_numpy_cached(base64_image)
 
         # Initial image size (height, width, channels) -> (width, height)
         original_size = (img_array.shape[1], img_array.shape[0])
 
-        # Check initial size
-        if len(base64_image) <= max_base64_size:
-            return numpy_to_base64(img_array, format=format, **kwargs), original_size
-
         # Initial reduction step
         reduction_step = initial_reduction
         new_size = original_size
@@ -213,7 +241,7 @@ def _detect_base64_image_format(base64_string: str) -> Optional[str]:
         raise ValueError(f"Invalid base64 string: {e}") from e
 
     try:
-        with Image.open(BytesIO(image_bytes)) as img:
+        with Image.open(_scratch_buffer(image_bytes)) as img:
             return img.format.upper()
     except ImportError:
         raise ImportError("Pillow library not available")
@@ -263,8 +291,9 @@ def ensure_base64_format(base64_image: str, target_format: str = "PNG", **kwargs
         return base64_image
 
     try:
-        # Decode the base64 image using OpenCV (returns RGB format)
-        img_array = base64_to_numpy(base64_image)
+        # Decode the base64 image using OpenCV (returns RGB format). The cached
+        # variant skips the decode entirely when the same image is re-submitted.
+        img_array = base64_to_numpy_cached(base64_image)
         # Re-encode in the target format
         return numpy_to_base64(img_array, format=target_format, **kwargs)
     except ImportError as e:
@@ -329,8 +358,10 @@ def pad_image(
     final_height = max(height, target_height)
     final_width = max(width, target_width)
 
-    # Create the canvas and place the original image on it
-    canvas = background_color * np.ones((final_height, final_width, array.shape[2]), dtype=dtype)
+    # Create the canvas and place the original image on it. np.full writes the
+    # background in a single pass instead of allocating a ones-buffer and then
+    # multiplying it, which walked the full canvas twice.
+    canvas = np.full((final_height, final_width, array.shape[2]), background_color, dtype=dtype)
 
     # Determine the padding needed, if any, while ensuring no padding is applied if the target is smaller
     if how == "center":
@@ -405,6 +436,21 @@ def crop_image(
     return cropped
 
 
+@lru_cache(maxsize=8)
+def _normalization_lut(means: Tuple[float, float, float], stds: Tuple[float, float, float]) -> np.ndarray:
+    """
+    Build a (256, 3) float32 table mapping each uint8 pixel value to its normalized
+    value per channel, i.e. ``(level / 255 - mean) / std``.
+
+    uint8 pixels only take 256 distinct values, so normalization reduces to a
+    table lookup with no per-pixel floating-point arithmetic.
+    """
+    levels = np.arange(256, dtype=np.float32).reshape((256, 1)) * np.float32(1.0 / 255.0)
+    mean = np.array(means, dtype=np.float32)
+    std = np.array(stds, dtype=np.float32)
+    return (levels - mean) / std
+
+
 def normalize_image(
     array: np.ndarray,
     r_mean: float = 0.485,
@@ -458,9 +504,20 @@ def normalize_image(
 
     height, width = array.shape[:2]
 
-    mean = np.array([r_mean, g_mean, b_mean]).reshape((1, 1, 3)).astype(np.float32)
-    std = np.array([r_std, g_std, b_std]).reshape((1, 1, 3)).astype(np.float32)
-    output_array = (array.astype("float32") / 255.0 - mean) / std
+    if array.dtype == np.uint8:
+        # Replace the arithmetic entirely with a precomputed per-channel lookup;
+        # advanced indexing with the (3,) channel index broadcasts over (H, W, 3).
+        lut = _normalization_lut((r_mean, g_mean, b_mean), (r_std, g_std, b_std))
+        return lut[array, np.arange(3)]
+
+    # Fold the [0, 255] -> [0, 1] scaling and the per-channel mean/std into a single
+    # multiply-add: (x / 255 - mean) / std == x * (1 / (255 * std)) - mean / std.
+    # This avoids materializing an intermediate float32 copy of the image and replaces
+    # the per-pixel divisions with multiplies.
+    mean = np.array([r_mean, g_mean, b_mean], dtype=np.float32).reshape((1, 1, 3))
+    std = np.array([r_std, g_std, b_std], dtype=np.float32).reshape((1, 1, 3))
+    output_array = np.multiply(array, np.float32(1.0 / 255.0) / std, dtype=np.float32)
+    output_array -= mean / std
 
     return output_array
 
@@ -550,10 +607,8 @@ def numpy_to_base64_png(array: np.ndarray) -> str:
         if cv2 is not None:
             png_bytes = _encode_opencv_png(array)
         else:
-            from io import BytesIO
-
             pil_img = Image.fromarray(array.astype(np.uint8))
-            buf = BytesIO()
+            buf = _scratch_buffer()
             pil_img.save(buf, format="PNG", compress_level=3)
             png_bytes = buf.getvalue()
         base64_img = bytetools.base64frombytes(png_bytes)
@@ -588,10 +643,8 @@ def numpy_to_base64_jpeg(array: np.ndarray, quality: int = 100) -> str:
         if cv2 is not None:
             jpeg_bytes = _encode_opencv_jpeg(array, quality=quality)
         else:
-            from io import BytesIO
-
             pil_img = Image.fromarray(array.astype(np.uint8)).convert("RGB")
-            buf = BytesIO()
+            buf = _scratch_buffer()
             pil_img.save(buf, format="JPEG", quality=quality)
             jpeg_bytes = buf.getvalue()
         base64_img = bytetools.base64frombytes(jpeg_bytes)
@@ -696,6 +749,10 @@ def base64_to_numpy(base64_string: str) -> np.ndarray:
     >>> img_array.shape
     (4, 4, 3)
     """
+    # Strip data URL prefix if present (e.g., "data:image/png;base64,")
+    if base64_string.startswith("data:") and "," in base64_string:
+        base64_string = base64_string.split(",", 1)[1]
+
     try:
         # Decode the base64 string to bytes using bytetools
         image_bytes = bytetools.bytesfrombase64(base64_string)
@@ -713,17 +770,17 @@ def base64_to_numpy(base64_string: str) -> np.ndarray:
             if img.ndim == 3 and img.shape[2] == 3:
                 img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
         else:
-            from io import BytesIO
-
-            pil_img = Image.open(BytesIO(image_bytes)).convert("RGB")
+            # convert() fully loads the pixels, so the scratch buffer is free for
+            # reuse as soon as this call returns.
+            pil_img = Image.open(_scratch_buffer(image_bytes)).convert("RGB")
             img = np.array(pil_img)
     except ImportError:
         raise
     except Exception as e:
         raise ValueError("Unable to decode image from base64 string") from e
 
-    # Convert to numpy array
-    img = np.array(img)
+    # Both branches above already yield a numpy array; re-wrapping with
+    # np.array() here would silently duplicate the full decoded image.
     # Assert that 3-channel images are in RGB format after conversion
     assert img.ndim <= 3, f"Image has unexpected number of dimensions: {img.ndim}"
     assert img.ndim != 3 or img.shape[2] == 3, f"3-channel image should have 3 channels, got: {img.shape[2]}"
@@ -731,6 +788,32 @@ def base64_to_numpy(base64_string: str) -> np.ndarray:
     return img
 
 
+@lru_cache(maxsize=128)
+def base64_to_numpy_cached(base64_string: str) -> np.ndarray:
+    """
+    LRU-cached variant of :func:`base64_to_numpy`.
+
+    Document pipelines frequently re-submit the same image across retries and
+    related calls; on a cache hit the full base64 + image decode is skipped.
+    The returned array is marked read-only because it is shared between callers —
+    use ``.copy()`` before mutating, or call :func:`base64_to_numpy` directly for
+    a private array.
+
+    Parameters
+    ----------
+    base64_string : str
+        Base64-encoded string representing an image.
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only NumPy array representation of the decoded image in RGB format.
+    """
+    img = base64_to_numpy(base64_string)
+    img.flags.writeable = False
+    return img
+
+
 def scale_numpy_image(
     img_arr: np.ndarray, scale_tuple: Optional[Tuple[int, int]] = None, interpolation=Image.LANCZOS
 ) -> np.ndarray:
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+from typing import Iterator
 from typing import Optional
 
 import backoff
@@ -21,6 +22,31 @@ except ImportError:
     cv2 = None
 logger = logging.getLogger(__name__)
 
+# Prebuilt data-URI prefix for embedding base64 images in payloads. Plain
+# concatenation with this constant avoids routing megabyte-sized base64
+# strings through the f-string formatting machinery.
+DATA_URI_PNG_PREFIX = "data:image/png;base64,"
+
+
+def chunk_list(lst: list, chunk_size: int) -> Iterator[list]:
+    """
+    Yield successive sublists of ``lst`` with length up to ``chunk_size``.
+
+    Shared by the model interfaces' ``format_input`` implementations. Defined at
+    module scope (rather than re-created as a closure per call) and implemented
+    as a generator so no intermediate list-of-lists is materialized.
+
+    Parameters
+    ----------
+    lst : list
+        The list to chunk.
+    chunk_size : int
+        Maximum length of each chunk; values below 1 are clamped to 1.
+    """
+    chunk_size = max(1, chunk_size)
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i : i + chunk_size]  # noqa: E203
+
 
 def preprocess_image_for_paddle(array: np.ndarray, image_max_dimension: int = 960) -> np.ndarray:
     """
@@ -11,6 +11,8 @@ from typing import List
 from typing import Optional
 
 from nemo_retriever.models.nim.primitives import ModelInterface
+from nemo_retriever.models.nim.primitives.model_interface.helpers import DATA_URI_PNG_PREFIX
+from nemo_retriever.models.nim.primitives.model_interface.helpers import chunk_list
 from nemo_retriever.common.api.util.image_processing.transforms import numpy_to_base64
 
 ACCEPTED_TEXT_CLASSES = set(
@@ -195,10 +197,6 @@ class NemotronParseModelInterface(ModelInterface):
             If an invalid protocol is specified.
         """
 
-        # Helper function: chunk a list into sublists of length <= chunk_size.
-        def chunk_list(lst: list, chunk_size: int) -> List[list]:
-            return [lst[i : i + chunk_size] for i in range(0, len(lst), chunk_size)]
-
         if protocol == "grpc":
             raise ValueError("gRPC protocol is not supported for Nemotron Parse.")
         elif protocol == "http":
@@ -288,21 +286,24 @@ class NemotronParseModelInterface(ModelInterface):
         return "v1.2" in self.model_name
 
     def _prepare_nemotron_parse_payload(self, base64_list: List[str]) -> Dict[str, Any]:
-        messages = []
+        # Preallocate and assign by index rather than appending; this avoids the
+        # amortized-resize ramp for batches larger than a handful of pages.
+        is_v1_2 = self._is_v1_2
+        messages: List[Dict[str, Any]] = [None] * len(base64_list)
 
-        for b64_img in base64_list:
+        for i, b64_img in enumerate(base64_list):
             content = []
-            if self._is_v1_2:
+            if is_v1_2:
                 content.append({"type": "text", "text": self._NEMOTRON_PARSE_PROMPT})
             content.append(
                 {
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/png;base64,{b64_img}",
+                        "url": DATA_URI_PNG_PREFIX + b64_img,
                     },
                 }
             )
-            messages.append({"role": "user", "content": content})
+            messages[i] = {"role": "user", "content": content}
 
         payload = {
             "model": self.model_name,
@@ -5,6 +5,7 @@
 from typing import Any, Dict, List, Optional, Tuple
 
 from nemo_retriever.models.nim.primitives import ModelInterface
+from nemo_retriever.models.nim.primitives.model_interface.helpers import chunk_list
 import numpy as np
 
 
@@ -57,11 +58,7 @@ class EmbeddingModelInterface(ModelInterface):
               - batch_data_list is a list of dictionaries containing the key "prompts" corresponding to each batch.
         """
 
-        def chunk_list(lst, chunk_size):
-            lst = lst["prompts"]
-            return [lst[i : i + chunk_size] for i in range(0, len(lst), chunk_size)]
-
-        batches = chunk_list(data, max_batch_size)
+        batches = chunk_list(data["prompts"], max_batch_size)
         if protocol == "http":
             payloads = []
             batch_data_list = []
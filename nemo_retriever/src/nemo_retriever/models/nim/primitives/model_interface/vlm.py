@@ -7,6 +7,8 @@ from typing import Dict, Any, Optional, Tuple, List
 import logging
 
 from nemo_retriever.models.nim.primitives import ModelInterface
+from nemo_retriever.models.nim.primitives.model_interface.helpers import DATA_URI_PNG_PREFIX
+from nemo_retriever.models.nim.primitives.model_interface.helpers import chunk_list
 
 logger = logging.getLogger(__name__)
 
@@ -86,64 +88,85 @@ class VLMModelInterface(ModelInterface):
         prompt = data["prompt"]
         system_prompt = data.get("system_prompt")
 
-        # Helper function to chunk the list into batches.
-        def chunk_list(lst, chunk_size):
-            return [lst[i : i + chunk_size] for i in range(0, len(lst), chunk_size)]
+        # Fast path: the overwhelmingly common single-image call needs no
+        # chunking machinery at all — build the one payload directly.
+        if len(images) == 1:
+            batches = [images]
+        else:
+            batches = chunk_list(images, max_batch_size)
 
-        batches = chunk_list(images, max_batch_size)
         payloads = []
         batch_data_list = []
         for batch in batches:
-            messages = []
-
-            if system_prompt:
-                messages.append(
-                    {
-                        "role": "system",
-                        "content": system_prompt,
-                    }
-                )
-            else:
-                logger.debug("VLM: No system prompt provided, using default")
-
-            # Create one message per image in the batch.
-            messages.extend(
-                [
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": f"{prompt}"},
-                            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{img}"}},
-                        ],
-                    }
-                    for img in batch
-                ]
-            )
-            payload = {
-                "model": kwargs.get("model_name"),
-                "messages": messages,
-                "max_tokens": kwargs.get("max_tokens", 512),
-                "temperature": kwargs.get("temperature", 1.0),
-                "top_p": kwargs.get("top_p", 1.0),
-                "stream": kwargs.get("stream", False),
-            }
-            for extra_key in ("chat_template_kwargs", "mm_processor_kwargs", "media_options"):
-                if kwargs.get(extra_key) is not None:
-                    payload[extra_key] = kwargs[extra_key]
-
-            extra_body = kwargs.get("extra_body")
-            if isinstance(extra_body, dict):
-                # Advanced callers may override core payload fields here; keep ordinary extras as
-                # first-class kwargs above when overriding model/messages/etc. is not intended.
-                payload.update(extra_body)
-
-            payloads.append(payload)
+            payloads.append(self._prepare_vlm_payload(batch, prompt, system_prompt, **kwargs))
             batch_data = {"base64_images": batch, "prompt": prompt}
             if system_prompt:
                 batch_data["system_prompt"] = system_prompt
             batch_data_list.append(batch_data)
         return payloads, batch_data_list
 
+    def _prepare_vlm_payload(
+        self, batch: List[str], prompt: str, system_prompt: Optional[str] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Build the chat-completions payload for one batch of base64 images.
+
+        Parameters
+        ----------
+        batch : list of str
+            Base64-encoded images for this payload (one user message each).
+        prompt : str
+            The caption prompt repeated for every image.
+        system_prompt : str, optional
+            Optional system message prepended to the conversation.
+        kwargs : dict
+            Same request parameters accepted by format_input.
+        """
+        messages = []
+
+        if system_prompt:
+            messages.append(
+                {
+                    "role": "system",
+                    "content": system_prompt,
+                }
+            )
+        else:
+            logger.debug("VLM: No system prompt provided, using default")
+
+        # Create one message per image in the batch.
+        messages.extend(
+            [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": f"{prompt}"},
+                        {"type": "image_url", "image_url": {"url": DATA_URI_PNG_PREFIX + img}},
+                    ],
+                }
+                for img in batch
+            ]
+        )
+        payload = {
+            "model": kwargs.get("model_name"),
+            "messages": messages,
+            "max_tokens": kwargs.get("max_tokens", 512),
+            "temperature": kwargs.get("temperature", 1.0),
+            "top_p": kwargs.get("top_p", 1.0),
+            "stream": kwargs.get("stream", False),
+        }
+        for extra_key in ("chat_template_kwargs", "mm_processor_kwargs", "media_options"):
+            if kwargs.get(extra_key) is not None:
+                payload[extra_key] = kwargs[extra_key]
+
+        extra_body = kwargs.get("extra_body")
+        if isinstance(extra_body, dict):
+            # Advanced callers may override core payload fields here; keep ordinary extras as
+            # first-class kwargs above when overriding model/messages/etc. is not intended.
+            payload.update(extra_body)
+
+        return payload
+
     def parse_output(self, response: Any, protocol: str, data: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
         """
         Parse the HTTP response from the VLM endpoint. Expects a response structure with a "choices" key.
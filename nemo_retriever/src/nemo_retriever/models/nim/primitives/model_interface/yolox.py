@@ -3,8 +3,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import os
 import warnings
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from math import log
 from typing import Any
 from typing import Dict
@@ -22,6 +24,8 @@ from nemo_retriever.models.nim.primitives.default_values import YOLOX_PAGE_IMAGE
 from nemo_retriever.models.nim.primitives.model_interface.decorators import global_cache
 from nemo_retriever.models.nim.primitives.model_interface.decorators import lock
 from nemo_retriever.models.nim.primitives.model_interface.decorators import multiprocessing_cache
+from nemo_retriever.models.nim.primitives.model_interface.helpers import DATA_URI_PNG_PREFIX
+from nemo_retriever.models.nim.primitives.model_interface.helpers import chunk_list
 from nemo_retriever.models.nim.primitives.model_interface.helpers import get_model_name
 from nemo_retriever.common.api.util.image_processing import scale_image_to_encoding_size
 from nemo_retriever.common.api.util.image_processing.transforms import numpy_to_base64
@@ -87,6 +91,36 @@ YOLOX_TABLE_CLASS_LABELS = [
 ]
 
 
+# Shared pool for per-image encode work in format_input. cv2.imencode and the
+# base64 codec both release the GIL, so threads give real parallelism on
+# multi-image batches; single-image calls stay inline to avoid pool overhead.
+_IMAGE_ENCODE_POOL: Optional[ThreadPoolExecutor] = None
+_IMAGE_ENCODE_POOL_LOCK = threading.Lock()
+
+
+def _chunk_list_geometrically(lst: list, max_size: int):
+    # TRT engine in Yolox NIM (gRPC) only allows a batch size in powers of 2.
+    i = 0
+    while i < len(lst):
+        chunk_size = max(1, min(2 ** int(log(len(lst) - i, 2)), max_size))
+        yield lst[i : i + chunk_size]  # noqa: E203
+        i += chunk_size
+
+
+def _map_images(encode_fn, images: list) -> list:
+    """Apply ``encode_fn`` to each image, using the shared thread pool for multi-image batches."""
+    if len(images) <= 1:
+        return [encode_fn(image) for image in images]
+
+    global _IMAGE_ENCODE_POOL
+    if _IMAGE_ENCODE_POOL is None:
+        with _IMAGE_ENCODE_POOL_LOCK:
+            if _IMAGE_ENCODE_POOL is None:
+                _IMAGE_ENCODE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+    return list(_IMAGE_ENCODE_POOL.map(encode_fn, images))
+
+
 # YoloxModelInterfaceBase implements methods shared by the YOLOX model interfaces.
 class YoloxModelInterfaceBase(ModelInterface):
     """
@@ -152,7 +186,10 @@ class YoloxModelInterfaceBase(ModelInterface):
         Parameters
         ----------
         data : dict
-            The input data containing a list of images.
+            The input data containing a list of images. Callers that already hold
+            base64 encodings of the images (e.g. from an upstream stage) may also
+            pass them under "base64_images", aligned with "images"; format_input
+            will then skip re-encoding, which is the heaviest step per image.
 
         Returns
         -------
@@ -162,11 +199,18 @@ class YoloxModelInterfaceBase(ModelInterface):
         if (not isinstance(data, dict)) or ("images" not in data):
             raise KeyError("Input data must be a dictionary containing an 'images' key with a list of images.")
 
-        if not all(isinstance(x, np.ndarray) for x in data["images"]):
-            raise ValueError("All elements in the 'images' list must be numpy.ndarray objects.")
+        # Validate and collect shapes in a single pass so a bad element
+        # short-circuits before any further per-image work is done.
+        original_image_shapes = []
+        for image in data["images"]:
+            if not isinstance(image, np.ndarray):
+                raise ValueError("All elements in the 'images' list must be numpy.ndarray objects.")
+            original_image_shapes.append(image.shape)
 
-        original_images = data["images"]
-        data["original_image_shapes"] = [image.shape for image in original_images]
+        data["original_image_shapes"] = original_image_shapes
+
+        if "base64_images" in data and len(data["base64_images"]) != len(data["images"]):
+            raise ValueError("The 'base64_images' list must align one-to-one with the 'images' list.")
 
         return data
 
@@ -206,27 +250,21 @@ class YoloxModelInterfaceBase(ModelInterface):
             If the protocol is invalid.
         """
 
-        # Helper functions to chunk a list into sublists of length up to chunk_size.
-        def chunk_list(lst: list, chunk_size: int) -> List[list]:
-            chunk_size = max(1, chunk_size)
-            return [lst[i : i + chunk_size] for i in range(0, len(lst), chunk_size)]
-
-        def chunk_list_geometrically(lst: list, max_size: int) -> List[list]:
-            # TRT engine in Yolox NIM (gRPC) only allows a batch size in powers of 2.
-            chunks = []
-            i = 0
-            while i < len(lst):
-                chunk_size = max(1, min(2 ** int(log(len(lst) - i, 2)), max_size))
-                chunks.append(lst[i : i + chunk_size])
-                i += chunk_size
-            return chunks
+        # Base64 encodings supplied by the caller (see prepare_data_for_inference)
+        # let us skip the per-image encode entirely.
+        precomputed_b64 = data.get("base64_images")
 
         if protocol == "grpc":
             logger.debug("Formatting input for gRPC Yolox Ensemble model")
-            b64_images = [numpy_to_base64(image, format=YOLOX_PAGE_IMAGE_FORMAT) for image in data["images"]]
-            b64_chunks = chunk_list_geometrically(b64_images, max_batch_size)
-            original_chunks = chunk_list_geometrically(data["images"], max_batch_size)
-            shape_chunks = chunk_list_geometrically(data["original_image_shapes"], max_batch_size)
+            if precomputed_b64 is not None:
+                b64_images = precomputed_b64
+            else:
+                b64_images = _map_images(
+                    lambda image: numpy_to_base64(image, format=YOLOX_PAGE_IMAGE_FORMAT), data["images"]
+                )
+            b64_chunks = _chunk_list_geometrically(b64_images, max_batch_size)
+            original_chunks = _chunk_list_geometrically(data["images"], max_batch_size)
+            shape_chunks = _chunk_list_geometrically(data["original_image_shapes"], max_batch_size)
 
             batched_inputs = []
             formatted_batch_data = []
@@ -240,8 +278,10 @@ class YoloxModelInterfaceBase(ModelInterface):
                     thresholds = np.array([[self.conf_threshold, self.iou_threshold]], dtype=np.float32)
                 else:
                     current_batch_size = input_array.shape[0]
-                    single_threshold_pair = [self.conf_threshold, self.iou_threshold]
-                    thresholds = np.tile(single_threshold_pair, (current_batch_size, 1)).astype(np.float32)
+                    # Tile directly in float32: tiling the Python list produces a
+                    # float64 array that astype then copies a second time.
+                    single_threshold_pair = np.array([self.conf_threshold, self.iou_threshold], dtype=np.float32)
+                    thresholds = np.tile(single_threshold_pair, (current_batch_size, 1))
 
                 batched_inputs.append([input_array, thresholds])
                 formatted_batch_data.append({"images": orig_chunk, "original_image_shapes": shapes})
@@ -250,16 +290,19 @@ class YoloxModelInterfaceBase(ModelInterface):
 
         elif protocol == "http":
             logger.debug("Formatting input for HTTP Yolox model")
-            content_list: List[Dict[str, Any]] = []
-            for image in data["images"]:
-                # Convert to uint8 if needed.
-                if image.dtype != np.uint8:
-                    image = (image * 255).astype(np.uint8)
-
-                # Get original size directly from numpy array (width, height)
-                original_size = (image.shape[1], image.shape[0])
-                # Convert numpy array directly to base64 using OpenCV
-                image_b64 = numpy_to_base64(image, format=YOLOX_PAGE_IMAGE_FORMAT)
+
+            def prepare_content(item: Tuple[np.ndarray, Optional[str], Tuple[int, ...]]) -> Dict[str, Any]:
+                image, image_b64, shape = item
+
+                # Original size as (width, height), from the shapes already cached
+                # by prepare_data_for_inference.
+                original_size = (shape[1], shape[0])
+                if image_b64 is None:
+                    # Convert to uint8 if needed.
+                    if image.dtype != np.uint8:
+                        image = (image * 255).astype(np.uint8)
+                    # Convert numpy array directly to base64 using OpenCV
+                    image_b64 = numpy_to_base64(image, format=YOLOX_PAGE_IMAGE_FORMAT)
                 # Scale the image if necessary.
                 scaled_image_b64, new_size = scale_image_to_encoding_size(
                     image_b64, max_base64_size=self.nim_max_image_size
@@ -267,7 +310,13 @@ class YoloxModelInterfaceBase(ModelInterface):
                 if new_size != original_size:
                     logger.debug(f"Image was scaled from {original_size} to {new_size}.")
 
-                content_list.append({"type": "image_url", "url": f"data:image/png;base64,{scaled_image_b64}"})
+                return {"type": "image_url", "url": DATA_URI_PNG_PREFIX + scaled_image_b64}
+
+            if precomputed_b64 is None:
+                precomputed_b64 = [None] * len(data["images"])
+            content_list: List[Dict[str, Any]] = _map_images(
+                prepare_content, list(zip(data["images"], precomputed_b64, data["original_image_shapes"]))
+            )
 
             # Chunk the payload content, the original images, and their shapes.
             content_chunks = chunk_list(content_list, max_batch_size)
@@ -359,14 +408,10 @@ class YoloxModelInterfaceBase(ModelInterface):
             results = output
 
         elif protocol == "grpc":
-            results = []
-            # For grpc, apply the same NIM postprocessing.
-            for out in output:
-                if isinstance(out, bytes):
-                    out = out.decode("utf-8")
-                if isinstance(out, dict):
-                    continue
-                results.append(json.loads(out))
+            # For grpc, apply the same NIM postprocessing. json.loads accepts
+            # bytes directly, so raw Triton outputs skip the intermediate
+            # str decode; already-parsed dict entries are dropped as before.
+            results = [json.loads(out) for out in output if not isinstance(out, dict)]
         inference_results = self.postprocess_annotations(results, **kwargs)
         return inference_results
 
@@ -380,17 +425,16 @@ class YoloxModelInterfaceBase(ModelInterface):
         for annotation_dict, shape in zip(results, original_image_shapes):
             new_dict = {}
             for label, bboxes_and_scores in annotation_dict.items():
-                new_dict[label] = []
-                for bbox_and_score in bboxes_and_scores:
-                    bbox = bbox_and_score[:4]
-                    transformed_bbox = [
-                        bbox[0] * shape[1],
-                        bbox[1] * shape[0],
-                        bbox[2] * shape[1],
-                        bbox[3] * shape[0],
-                    ]
-                    transformed_bbox += bbox_and_score[4:]
-                    new_dict[label].append(transformed_bbox)
+                if not len(bboxes_and_scores):
+                    new_dict[label] = []
+                    continue
+                # Scale all boxes for a label in one vectorized multiply instead of
+                # per-box Python arithmetic; columns past the bbox (score, ...) are
+                # left untouched by the unit scale factors.
+                arr = np.asarray(bboxes_and_scores, dtype=np.float64)
+                scale = np.ones(arr.shape[1])
+                scale[:4] = (shape[1], shape[0], shape[1], shape[0])
+                new_dict[label] = (arr * scale).tolist()
             transformed_results.append(new_dict)
 
         return transformed_results
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import base64
+
+import numpy as np
+
+from nemo_retriever.common.api.util.converters import bytetools
+from nemo_retriever.common.api.util.image_processing.transforms import base64_to_numpy
+from nemo_retriever.common.api.util.image_processing.transforms import base64_to_numpy_cached
+from nemo_retriever.common.api.util.image_processing.transforms import normalize_image
+from nemo_retriever.common.api.util.image_processing.transforms import numpy_to_base64
+from nemo_retriever.common.api.util.image_processing.transforms import scale_image_to_encoding_size
+
+
+def test_bytetools_base64_round_trip_matches_stdlib():
+    payload = bytes(range(256)) * 16
+    encoded = bytetools.base64frombytes(payload)
+    assert encoded == base64.b64encode(payload).decode("utf-8")
+    assert bytetools.bytesfrombase64(encoded) == payload
+
+
+def test_base64_to_numpy_round_trip():
+    image = np.random.randint(0, 255, (8, 6, 3), dtype=np.uint8)
+    decoded = base64_to_numpy(numpy_to_base64(image))
+    assert decoded.shape == (8, 6, 3)
+    np.testing.assert_array_equal(decoded, image)
+
+
+def test_base64_to_numpy_cached_returns_shared_readonly_array():
+    image = np.random.randint(0, 255, (8, 6, 3), dtype=np.uint8)
+    b64 = numpy_to_base64(image)
+    first = base64_to_numpy_cached(b64)
+    second = base64_to_numpy_cached(b64)
+    assert first is second
+    assert not first.flags.writeable
+    np.testing.assert_array_equal(first, image)
+
+
+def test_normalize_image_matches_reference_formula():
+    image = np.random.randint(0, 255, (16, 12, 3), dtype=np.uint8)
+    mean = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+    std = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+    expected = (image.astype(np.float32) / 255.0 - mean) / std
+
+    normalized = normalize_image(image)
+
+    assert normalized.dtype == np.float32
+    np.testing.assert_allclose(normalized, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_normalize_image_uint8_and_float_inputs_agree():
+    image = np.random.randint(0, 255, (16, 12, 3), dtype=np.uint8)
+    np.testing.assert_allclose(
+        normalize_image(image),
+        normalize_image(image.astype(np.float64)),
+        rtol=1e-5,
+        atol=1e-6,
+    )
+
+
+def test_base64_to_numpy_strips_data_uri_prefix():
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    b64 = numpy_to_base64(image)
+    decoded = base64_to_numpy(f"data:image/png;base64,{b64}")
+    assert decoded.shape == (4, 4, 3)
+
+
+def test_scale_image_to_encoding_size_returns_small_images_unchanged():
+    image = np.random.randint(0, 255, (20, 30, 3), dtype=np.uint8)
+    b64 = numpy_to_base64(image)
+    scaled_b64, size = scale_image_to_encoding_size(b64, max_base64_size=len(b64))
+    assert scaled_b64 == b64
+    assert size == (30, 20)
+
+
+def test_scale_image_to_encoding_size_shrinks_large_images():
+    image = np.random.randint(0, 255, (200, 300, 3), dtype=np.uint8)
+    b64 = numpy_to_base64(image)
+    max_size = len(b64) // 2
+    scaled_b64, size = scale_image_to_encoding_size(b64, max_base64_size=max_size)
+    assert len(scaled_b64) <= max_size
+    assert size[0] < 300 and size[1] < 200